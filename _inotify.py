@@ -0,0 +1,69 @@
+"""
+Minimal inotify(7) wrapper for git-dashboard.py.
+
+Only what the dashboard needs: add/remove watches and a blocking reader that
+yields (wd, mask, name) tuples, meant to run on a daemon thread. Creating an
+Inotify raises OSError where inotify is unavailable (non-Linux).
+"""
+
+import ctypes
+import os
+import struct
+import sys
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+# struct inotify_event header; name follows, NUL padded to len bytes
+_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            self._raise()
+
+    def _raise(self, path=None):
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+
+    def add_watch(self, path, mask):
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            self._raise(path)
+        return wd
+
+    def rm_watch(self, wd):
+        # Fails harmlessly if the kernel already dropped the watch
+        self._rm_watch(self.fd, wd)
+
+    def read_events(self):
+        # Blocks until events arrive; loops forever
+        while True:
+            data = os.read(self.fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                yield wd, mask, os.fsdecode(name)
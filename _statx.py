@@ -0,0 +1,119 @@
+"""
+Minimal statx(2) wrapper for git-dashboard.py.
+
+statx lets the repo scan ask for just the mode and mtime, and with
+AT_STATX_DONT_SYNC a network filesystem may answer from its attribute cache
+instead of a GETATTR round-trip to the server. Where statx is unavailable
+(non-Linux, old kernels or libcs) fast_stat falls back to os.stat.
+"""
+
+import ctypes
+import os
+import platform
+import sys
+
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_MODE = 0x0002
+STATX_MTIME = 0x0040
+
+# Used when libc has no statx() wrapper (glibc < 2.28)
+_NR_STATX = {
+    "x86_64": 332,
+    "aarch64": 291,
+    "riscv64": 291,
+    "i686": 383,
+    "ppc64le": 383,
+    "s390x": 379,
+}
+
+
+class _Timestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from <linux/stat.h>, 256 bytes
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _Timestamp),
+        ("stx_btime", _Timestamp),
+        ("stx_ctime", _Timestamp),
+        ("stx_mtime", _Timestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    if hasattr(libc, "statx"):
+        func = libc.statx
+        func.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.c_uint,
+            ctypes.POINTER(_Statx),
+        ]
+        func.restype = ctypes.c_int
+        return func
+    nr = _NR_STATX.get(platform.machine())
+    if nr is None:
+        return None
+    syscall = libc.syscall
+    syscall.restype = ctypes.c_long
+
+    def func(dir_fd, path, flags, mask, buf):
+        return syscall(
+            ctypes.c_long(nr),
+            ctypes.c_int(dir_fd),
+            ctypes.c_char_p(path),
+            ctypes.c_int(flags),
+            ctypes.c_uint(mask),
+            ctypes.byref(buf),
+        )
+
+    return func
+
+
+_statx = _load_statx()
+
+
+def fast_stat(dir_fd, name, flags=AT_STATX_DONT_SYNC):
+    # Returns (st_mode, st_mtime_ns) for name relative to dir_fd (None for
+    # the cwd), following symlinks like os.stat. Raises OSError on failure.
+    if _statx is None:
+        st = os.stat(name, dir_fd=dir_fd)
+        return st.st_mode, st.st_mtime_ns
+    buf = _Statx()
+    fd = AT_FDCWD if dir_fd is None else dir_fd
+    if _statx(fd, os.fsencode(name), flags, STATX_TYPE | STATX_MODE | STATX_MTIME, buf):
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), name)
+    mtime = buf.stx_mtime
+    return buf.stx_mode, mtime.tv_sec * 1_000_000_000 + mtime.tv_nsec
@@ -0,0 +1,80 @@
+"""
+Hot-path helpers for git-dashboard.py.
+
+Kept free of Tk and I/O so the module can optionally be compiled with mypyc
+(`mypyc dashboard_hot.py`). A compiled extension sitting next to this file is
+picked up automatically by the import system; otherwise this pure-Python
+version is used.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+
+
+class Repo:
+    # Slotted record: smaller than a dict and attribute reads are a slot load
+    __slots__ = ("name", "name_lower", "display_name", "path", "mtime", "time_ago")
+
+    def __init__(self, name: str, path: str, mtime: float, time_ago: str) -> None:
+        self.name = name
+        # casefold, not lower, so e.g. "Straße" matches a search for "strasse"
+        self.name_lower = name.casefold()
+        self.display_name = "  " + name
+        self.path = path
+        self.mtime = mtime
+        self.time_ago = time_ago
+
+
+# Unit boundaries in seconds, and the (divisor, suffix) for the range below,
+# between and above them; bisect picks the range with one C-level search
+_THRESHOLDS = (60, 3600, 86400)
+_UNITS = ((1, "s"), (60, "m"), (3600, "h"), (86400, "d"))
+
+
+@lru_cache(maxsize=4096)
+def _fmt(n: int, suffix: str) -> str:
+    # Many repos share a label ("3d ago"), so reuse the formatted string
+    return f"{n}{suffix} ago"
+
+
+def get_time_ago(timestamp: float, now: float) -> str:
+    # Callers read the clock once per batch and pass it in, so labelling N
+    # repos costs one time.time() rather than N
+    if timestamp == 0:
+        return "Never"
+    s = now - timestamp
+    div, suffix = _UNITS[bisect_right(_THRESHOLDS, s)]
+    return _fmt(int(s // div), suffix)
+
+
+# Repo path -> (timestamp, time its label next changes, label)
+_labels: dict[str, tuple[float, float, str]] = {}
+
+
+def time_ago_for(key: str, timestamp: float, now: float) -> str:
+    # get_time_ago, but reuses the label from the last call for this repo
+    # until the clock crosses into its next bucket ("4m" -> "5m", "2d" ->
+    # "3d"), so rescans and the label tick only format what changed
+    hit = _labels.get(key)
+    if hit is not None and hit[0] == timestamp and now < hit[1]:
+        return hit[2]
+    label = get_time_ago(timestamp, now)
+    if timestamp == 0:
+        until = float("inf")
+    else:
+        s = now - timestamp
+        div = _UNITS[bisect_right(_THRESHOLDS, s)][0]
+        until = timestamp + (s // div + 1) * div
+    _labels[key] = (timestamp, until, label)
+    return label
+
+
+def filter_repos(names_lower: list[str], order: list[int], term: str) -> list[int]:
+    # Indices from order (a precomputed sort) whose name contains term;
+    # names_lower is the casefolded-name column, parallel to the repo list
+    if not term:
+        return list(order)
+    # A name shorter than the term can't contain it; the length compare is
+    # cheaper than setting up the substring search
+    n = len(term)
+    return [i for i in order if len(names_lower[i]) >= n and term in names_lower[i]]
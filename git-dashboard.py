@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 import os
+import pickle
+import queue
+import re
 import subprocess
 import sys
+import threading
+import time
 import tkinter as tk
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from tkinter import filedialog, messagebox, ttk
 
 from dotenv import load_dotenv, set_key
 
+import _inotify
+from _statx import fast_stat
+from dashboard_hot import Repo, filter_repos, time_ago_for
+
 """
 GIT REPO DASHBOARD
 ==================
@@ -20,11 +31,16 @@ DESCRIPTION:
 DEPENDENCIES:
     - python3-tk (Standard Library)
     - python-dotenv (pip install python-dotenv)
+    - mypyc (optional, compiles dashboard_hot.py for faster filtering)
 
 CONFIGURATION:
     Configuration is managed via a '.env' file in the script's directory.
     - BASE_PATH: The parent directory containing your Git repos.
     - EDITOR_COMMAND: The CLI command to open your editor (e.g., 'zed', 'code').
+    - SCAN_DEPTH: Folder levels to descend into looking for nested repos
+      (default 0: only BASE_PATH's direct children).
+    - DASHBOARD_SCAN_REMOTE: Set to '1' to scan a network-mounted BASE_PATH
+      (nfs, cifs, sshfs, ...) on startup instead of waiting for a click.
 
 SETUP:
     Run the provided 'setup.sh' to create a system-wide 'repos' command.
@@ -38,6 +54,15 @@ load_dotenv(ENV_PATH)
 # Initial global configs
 EDITOR_COMMAND = os.getenv("EDITOR_COMMAND", "code")
 BASE_PATH = os.getenv("BASE_PATH", os.path.expanduser("~/Documents"))
+# How many folder levels below BASE_PATH's children to search for nested
+# repos; 0 only looks at BASE_PATH's direct children. Bad values fall back
+# to 0 rather than stop a launch whose output goes to /dev/null.
+try:
+    SCAN_DEPTH = max(0, int(os.getenv("SCAN_DEPTH", "0")))
+except ValueError:
+    SCAN_DEPTH = 0
+# Network mounts are only scanned on startup when explicitly opted in
+SCAN_REMOTE = os.getenv("DASHBOARD_SCAN_REMOTE") == "1"
 
 # --- DARK THEME COLORS ---
 BG_MAIN = "#1e1e1e"
@@ -49,51 +74,311 @@ SELECTED = "#094771"
 SUCCESS = "#2ea043"
 HOVER = "#444444"
 
+# BASE_PATH's folder listing from the last scan, keyed on its stat
+_repo_cache = {}
+# Repo path -> .git mtime_ns when it was last seen without COMMIT_EDITMSG
+_no_commit_msg = {}
+# Never descended into when searching for nested repos
+PRUNE_DIRS = {"node_modules", "venv", "__pycache__"}
+# Last scan persisted between launches so the list renders before a rescan
+SCAN_CACHE = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "git-dashboard",
+    "repos.pkl",
+)
+
+REMOTE_FS_TYPES = {
+    "9p",
+    "afs",
+    "ceph",
+    "cifs",
+    "fuse.rclone",
+    "fuse.sshfs",
+    "glusterfs",
+    "nfs",
+    "nfs4",
+    "smb3",
+    "smbfs",
+    "sshfs",
+}
+
+# Matching rows are attached a page at a time, the next page once the view
+# scrolls to the bottom; well over a screenful so one page normally suffices
+RENDER_PAGE = 100
+
+# Bulk Treeview helpers, so filling or reordering the table costs a single
+# Python -> Tcl round-trip instead of one (or two) per row
+TCL_HELPERS = """
+proc gitdash_fill {tree rows} {
+    set i 0
+    foreach {id name ago} $rows {
+        $tree insert {} end -id $id -values [list $name $ago] \
+            -tags [expr {$i % 2 ? "oddrow" : "evenrow"}]
+        incr i
+    }
+}
+proc gitdash_show {tree ids {start 0}} {
+    set i $start
+    foreach id $ids {
+        $tree move $id {} $i
+        $tree item $id -tags [expr {$i % 2 ? "oddrow" : "evenrow"}]
+        incr i
+    }
+}
+"""
 
-def get_time_ago(timestamp):
-    if timestamp == 0:
-        return "Never"
-    diff = datetime.now() - datetime.fromtimestamp(timestamp)
-    s = diff.total_seconds()
-    if s < 60:
-        return f"{int(s)}s ago"
-    if s < 3600:
-        return f"{int(s // 60)}m ago"
-    if s < 86400:
-        return f"{int(s // 3600)}h ago"
-    return f"{int(s // 86400)}d ago"
+
+def is_remote_fs(path):
+    # Linux only: find the mount holding path in /proc/self/mountinfo and
+    # check its filesystem type. Anything unreadable counts as local.
+    real = os.path.realpath(os.path.expanduser(path))
+    best, fs_type = "", None
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields = line.split()
+                # Mount points escape spaces etc. as octal, e.g. "\040"
+                mount = re.sub(
+                    r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[4]
+                )
+                if real != mount and not real.startswith(mount.rstrip("/") + "/"):
+                    continue
+                # Deepest (and, for stacked mounts, latest) match wins
+                if len(mount) >= len(best):
+                    best, fs_type = mount, fields[fields.index("-") + 1]
+    except (OSError, ValueError, IndexError):
+        return False
+    return fs_type in REMOTE_FS_TYPES
+
+
+def get_commit_mtime(name, dir_fd, key=None):
+    # EAFP: a single stat in the common case, falling back to the .git entry
+    # itself for repos that have never been committed to. Raises OSError when
+    # there is no .git, i.e. the folder is not a repository. Paths are
+    # resolved relative to dir_fd so the kernel doesn't re-walk BASE_PATH,
+    # and fast_stat uses statx(AT_STATX_DONT_SYNC) where available.
+    key = key or name
+    known = _no_commit_msg.get(key)
+    if known is not None:
+        # Creating COMMIT_EDITMSG would bump .git's mtime, so while that is
+        # unchanged the file is still missing and one stat is enough
+        _, mtime_ns = fast_stat(dir_fd, f"{name}/.git")
+        if mtime_ns == known:
+            return mtime_ns / 1e9
+    try:
+        _, mtime_ns = fast_stat(dir_fd, f"{name}/.git/COMMIT_EDITMSG")
+        _no_commit_msg.pop(key, None)
+    except OSError:
+        _, mtime_ns = fast_stat(dir_fd, f"{name}/.git")
+        _no_commit_msg[key] = mtime_ns
+    return mtime_ns / 1e9
 
 
-def get_git_repos(path):
+def _stat_one(dir_fd, now, candidate):
+    name, repo_path = candidate
+    try:
+        mtime = get_commit_mtime(name, dir_fd, repo_path)
+    except OSError:
+        return None
+    return Repo(name, repo_path, mtime, time_ago_for(repo_path, mtime, now))
+
+
+def iter_repos(root, max_depth):
+    # Depth-first walk with an explicit stack of scandir listings (no
+    # os.walk). Yields (name relative to root, path) candidates: folders
+    # whose listing shows a .git, which are not descended into, plus every
+    # folder at max_depth, which the caller stats like a direct child.
+    stack = [("", root, 0)]
+    while stack:
+        rel, path, depth = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                children = [
+                    (entry.name, entry.path)
+                    for entry in entries
+                    if entry.name == ".git"
+                    or (
+                        not entry.name.startswith(".")
+                        and entry.name not in PRUNE_DIRS
+                        # BASE_PATH's own children follow symlinks, as the
+                        # depth-0 scan does; deeper links could loop
+                        and entry.is_dir(follow_symlinks=not depth)
+                    )
+                ]
+        except OSError:
+            continue
+        if depth and any(name == ".git" for name, _ in children):
+            yield rel.rstrip("/"), path
+            continue
+        for name, child in children:
+            if name == ".git":
+                continue
+            if depth == max_depth:
+                yield rel + name, child
+            else:
+                stack.append((rel + name + "/", child, depth + 1))
+
+
+def get_git_repos(path, max_depth=0):
     repos = []
     try:
         expanded_path = os.path.expanduser(path)
-        if not os.path.exists(expanded_path):
+        try:
+            parent_fd = os.open(
+                expanded_path, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+            )
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        with os.scandir(expanded_path) as entries:
-            for entry in entries:
-                git_dir = os.path.join(entry.path, ".git")
-                if entry.is_dir() and os.path.exists(git_dir):
-                    msg_file = os.path.join(git_dir, "COMMIT_EDITMSG")
-                    mtime = (
-                        os.path.getmtime(msg_file)
-                        if os.path.exists(msg_file)
-                        else os.path.getmtime(git_dir)
-                    )
-                    repos.append(
-                        {
-                            "name": entry.name,
-                            "path": entry.path,
-                            "mtime": mtime,
-                            "time_ago": get_time_ago(mtime),
-                        }
-                    )
+        try:
+            # The folder listing only changes when BASE_PATH's own mtime/ctime
+            # does, so reuse the last enumeration and just restat each folder.
+            # Non-repos stay in it: `git init` in an existing folder leaves
+            # BASE_PATH untouched, and only the .git probe notices.
+            st = os.fstat(parent_fd)
+            key = (expanded_path, max_depth, st.st_mtime_ns, st.st_ctime_ns)
+            if max_depth:
+                # Nested folders can change without touching BASE_PATH's
+                # mtime, so the listing cache only applies at depth 0
+                candidates = list(iter_repos(expanded_path, max_depth))
+            elif _repo_cache.get("key") == key:
+                candidates = _repo_cache["value"]
+            else:
+                # Read the listing through the fd we already hold rather than
+                # resolving BASE_PATH again; entries then carry bare names
+                prefix = os.path.join(expanded_path, "")
+                with os.scandir(parent_fd) as entries:
+                    # Cheap checks first: the name test costs nothing and
+                    # is_dir() is answered from the readdir d_type; only
+                    # symlinks (followed, so linked repos still show) stat
+                    candidates = [
+                        (entry.name, prefix + entry.name)
+                        for entry in entries
+                        if not entry.name.startswith(".") and entry.is_dir()
+                    ]
+            stat_one = partial(_stat_one, parent_fd, time.time())
+            if len(candidates) < 8:
+                # Too few to be worth starting threads for
+                repos = [repo for repo in map(stat_one, candidates) if repo]
+            else:
+                # stat releases the GIL, so a pool overlaps the per-repo
+                # latency on network mounts instead of paying it serially
+                with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as ex:
+                    repos = [repo for repo in ex.map(stat_one, candidates) if repo]
+        finally:
+            os.close(parent_fd)
+        # Also what save_scan_cache persists, at any depth
+        _repo_cache["key"] = key
+        _repo_cache["value"] = candidates
         return repos
     except Exception as e:
         print(f"Error: {e}")
         return []
 
 
+def load_scan_cache(path, max_depth=0):
+    # Returns the repos saved by the last launch, or None unless they were
+    # scanned from this same BASE_PATH and depth, and its listing hasn't
+    # changed since
+    try:
+        with open(SCAN_CACHE, "rb") as f:
+            data = pickle.load(f)
+        expanded_path = os.path.expanduser(path)
+        st = os.stat(expanded_path)
+        key = (expanded_path, max_depth, st.st_mtime_ns, st.st_ctime_ns)
+        if data["key"] != key:
+            return None
+        now = time.time()
+        repos = [
+            Repo(name, repo_path, mtime, time_ago_for(repo_path, mtime, now))
+            for name, repo_path, mtime in data["repos"]
+        ]
+        listing = data["listing"]
+    except Exception:
+        return None
+    # The enumeration is still valid, so the first refresh can skip it too
+    _repo_cache["key"] = data["key"]
+    _repo_cache["value"] = listing
+    return repos
+
+
+def save_scan_cache(path, repos):
+    key = _repo_cache.get("key")
+    if not key or key[0] != os.path.expanduser(path):
+        return
+    data = {
+        "key": key,
+        # Every listed folder, repo or not, so a folder that became a repo
+        # since is still probed after a relaunch
+        "listing": _repo_cache["value"],
+        "repos": [(r.name, r.path, r.mtime) for r in repos],
+    }
+    try:
+        os.makedirs(os.path.dirname(SCAN_CACHE), exist_ok=True)
+        tmp = f"{SCAN_CACHE}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f)
+        os.replace(tmp, SCAN_CACHE)
+    except OSError as e:
+        print(f"Error: {e}")
+
+
+def scan_repos(path):
+    # Worker-thread entry point: scan, then persist for the next launch
+    repos = get_git_repos(path, SCAN_DEPTH)
+    save_scan_cache(path, repos)
+    return repos
+
+
+def apply_dark_style(style):
+    # Styles live in the Tcl interpreter, so mark it once configured; further
+    # launchers on the same root then cost a single Tcl call here
+    if style.tk.getboolean(style.tk.call("info", "exists", "gitdash_styled")):
+        return
+    style.theme_use("clam")
+    style.configure(
+        "Treeview",
+        background=BG_MAIN,
+        foreground=FG_TEXT,
+        fieldbackground=BG_MAIN,
+        borderwidth=0,
+        font=("Segoe UI", 10),
+    )
+    style.map(
+        "Treeview",
+        background=[("selected", SELECTED)],
+        foreground=[("selected", "white")],
+    )
+    style.configure(
+        "Treeview.Heading",
+        background=BG_HEADER,
+        foreground=ACCENT,
+        relief="flat",
+        font=("Segoe UI", 10, "bold"),
+    )
+    style.map("Treeview.Heading", background=[("active", HOVER)])
+    style.tk.setvar("gitdash_styled", 1)
+
+
+def launch_editor(argv):
+    # posix_spawnp avoids fork()ing (and copying the page tables of) the Tk
+    # process; output goes to /dev/null and Python continues immediately
+    if not hasattr(os, "posix_spawnp"):
+        subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    pid = os.posix_spawnp(
+        argv[0],
+        argv,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ],
+    )
+    # Reap the editor's launcher in the background so it doesn't linger as
+    # a zombie while the dashboard stays open
+    threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+
+
 # --- CUSTOM DARK FOLDER BROWSER ---
 class DarkFolderBrowser(tk.Toplevel):
     def __init__(self, parent, initial_dir):
@@ -150,8 +435,7 @@ class DarkFolderBrowser(tk.Toplevel):
         self.load_dir()
 
     def load_dir(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         self.path_label.config(text=self.current_dir)
         try:
             entries = sorted(
@@ -269,6 +553,7 @@ class SettingsWindow(tk.Toplevel):
         set_key(ENV_PATH, "BASE_PATH", new_path)
         global EDITOR_COMMAND, BASE_PATH
         EDITOR_COMMAND, BASE_PATH = new_editor, new_path
+        _repo_cache.clear()
         self.launcher.refresh_data()
         self.destroy()
 
@@ -276,41 +561,43 @@ class SettingsWindow(tk.Toplevel):
 class DarkRepoLauncher:
     def __init__(self, root):
         self.root = root
-        self.root.title("Git Repo Dashboard")
-        self.root.geometry("550x650")
-        self.root.configure(bg=BG_MAIN)
+        root.title("Git Repo Dashboard")
+        root.geometry("550x650")
+        root.configure(bg=BG_MAIN)
+        root.tk.eval(TCL_HELPERS)
 
         # CLEAN EXIT PROTOCOLS
-        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
-        self.root.bind("<Escape>", self.quit_app)
+        root.protocol("WM_DELETE_WINDOW", self.quit_app)
+        root.bind("<Escape>", self.quit_app)
 
         self.sort_reverse = {"Name": False, "Last Commit": True}
         self.all_repos = []
+        # Indices into all_repos, precomputed per scan for each sort column,
+        # plus the casefolded-name column that sorting and search read
+        self._names_lower = []
+        self._by_name = []
+        self._by_mtime = []
+        self._order = []
+        # Last search and its matches; a longer term only needs to re-check
+        # those rather than all of _order
+        self._last_term = ""
+        self._last_matches = []
+        self._scan_token = 0
+        # One scan at a time; queued rescans run after it, never alongside
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Tree rows are created once per scan and only detached/moved while
+        # filtering; each row's item id is its repo path
+        self._row_ids = ()
+        # Every id the current search matches, in display order, and the
+        # prefix of it actually attached to the tree
+        self._matched = ()
+        self._shown = ()
+        self._render_upto = RENDER_PAGE
+        self._start_watcher()
 
         # Style Configuration
         self.style = ttk.Style()
-        self.style.theme_use("clam")
-        self.style.configure(
-            "Treeview",
-            background=BG_MAIN,
-            foreground=FG_TEXT,
-            fieldbackground=BG_MAIN,
-            borderwidth=0,
-            font=("Segoe UI", 10),
-        )
-        self.style.map(
-            "Treeview",
-            background=[("selected", SELECTED)],
-            foreground=[("selected", "white")],
-        )
-        self.style.configure(
-            "Treeview.Heading",
-            background=BG_HEADER,
-            foreground=ACCENT,
-            relief="flat",
-            font=("Segoe UI", 10, "bold"),
-        )
-        self.style.map("Treeview.Heading", background=[("active", HOVER)])
+        apply_dark_style(self.style)
 
         # Top Bar
         top_frame = tk.Frame(root, bg=BG_MAIN)
@@ -323,7 +610,8 @@ class DarkRepoLauncher:
             font=("Segoe UI", 8, "bold"),
         ).pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self.update_list)
+        self._pending_filter = None
+        self.search_var.trace_add("write", self._on_search_changed)
         self.search_entry = tk.Entry(
             top_frame,
             textvariable=self.search_var,
@@ -361,27 +649,39 @@ class DarkRepoLauncher:
         )
         self.btn_settings.pack(side=tk.LEFT, padx=2)
 
+        # Remote FS banner, shown instead of auto-scanning a network mount
+        self.remote_banner = tk.Label(
+            root,
+            text="Remote filesystem — click to scan",
+            bg=BG_HEADER,
+            fg=ACCENT,
+            font=("Segoe UI", 9, "bold"),
+            cursor="hand2",
+        )
+        self.remote_banner.bind("<Button-1>", lambda e: self.refresh_data())
+
         # Table
         self.tree_frame = tk.Frame(root, bg=BG_MAIN)
         self.tree_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
-        self.tree = ttk.Treeview(
-            self.tree_frame, columns=("Name", "Last Commit"), show="headings"
+        self.tree = tree = ttk.Treeview(
+            self.tree_frame,
+            columns=("Name", "Last Commit"),
+            show="headings",
+            yscrollcommand=self._on_tree_scroll,
         )
-        self.tree.heading(
-            "Name", text=" NAME", command=lambda: self.sort_column("Name")
-        )
-        self.tree.heading(
+        tree.heading("Name", text=" NAME", command=lambda: self.sort_column("Name"))
+        tree.heading(
             "Last Commit",
             text=" LAST COMMIT",
             command=lambda: self.sort_column("Last Commit"),
         )
-        self.tree.column("Name", width=300)
-        self.tree.column("Last Commit", width=100, anchor="center")
-        self.tree.tag_configure("oddrow", background=BG_MAIN)
-        self.tree.tag_configure("evenrow", background=BG_STRIPE)
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.tree.bind("<Double-1>", self.open_repo)
-        self.tree.bind("<Return>", self.open_repo)
+        tree.column("Name", width=300)
+        tree.column("Last Commit", width=100, anchor="center")
+        tree.tag_configure("oddrow", background=BG_MAIN)
+        tree.tag_configure("evenrow", background=BG_STRIPE)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        tree.bind("<Double-1>", self.open_repo)
+        tree.bind("<Return>", self.open_repo)
 
         # Status & Button
         self.status_var = tk.StringVar()
@@ -406,62 +706,277 @@ class DarkRepoLauncher:
         )
         self.btn_open.pack(fill=tk.X, padx=15, pady=15, ipady=8)
 
-        self.refresh_data()
+        # Show the previous launch's list at once, then rescan in the
+        # background. Validating the cache stats BASE_PATH on this thread, so
+        # leave remote mounts to the banner rather than risk a hung startup.
+        if SCAN_REMOTE or not is_remote_fs(BASE_PATH):
+            cached = load_scan_cache(BASE_PATH, SCAN_DEPTH)
+            if cached is not None:
+                self._apply_scan(self._scan_token, cached)
+        root.after(50, self.refresh_data, True)
+        root.after(60_000, self._tick_labels)
 
     def open_settings(self):
         SettingsWindow(self)
 
     def quit_app(self, event=None):
+        self._executor.shutdown(wait=False, cancel_futures=True)
         # This breaks the mainloop AND kills the underlying Tcl interpreter
         self.root.quit()
         self.root.destroy()
         os._exit(0)  # The most "forceful" exit available in Python
 
-    def refresh_data(self):
-        self.all_repos = get_git_repos(BASE_PATH)
+    def _start_watcher(self):
+        # inotify on BASE_PATH and each repo's .git pushes commit times to the
+        # UI instead of relying on ↻; quietly disabled where unavailable
+        self._watch_wds = {}  # watched path -> wd
+        self._watch_paths = {}  # wd -> repo path (None for BASE_PATH)
+        self._inotify_events = queue.Queue()
+        try:
+            self._inotify = _inotify.Inotify()
+        except (OSError, AttributeError):
+            self._inotify = None
+            return
+        threading.Thread(target=self._inotify_reader, daemon=True).start()
+        self.root.after(250, self._drain_inotify)
+
+    def _inotify_reader(self):
+        for event in self._inotify.read_events():
+            self._inotify_events.put(event)
+
+    def _update_watches(self, base, repos):
+        wanted = {base: None}
+        for repo in repos:
+            wanted[repo.path + "/.git"] = repo.path
+        for path in list(self._watch_wds):
+            if path not in wanted:
+                wd = self._watch_wds.pop(path)
+                self._watch_paths.pop(wd, None)
+                self._inotify.rm_watch(wd)
+        for path, repo_path in wanted.items():
+            if path in self._watch_wds:
+                continue
+            if repo_path is None:
+                mask = _inotify.IN_CREATE | _inotify.IN_DELETE | _inotify.IN_MOVED_FROM
+                mask |= _inotify.IN_MOVED_TO | _inotify.IN_ONLYDIR
+            else:
+                mask = _inotify.IN_CLOSE_WRITE | _inotify.IN_MOVED_TO
+                mask |= _inotify.IN_ONLYDIR
+            try:
+                wd = self._inotify.add_watch(path, mask)
+            except OSError:
+                # e.g. a '.git' file (worktree) or the watch limit was hit
+                continue
+            self._watch_wds[path] = wd
+            self._watch_paths[wd] = repo_path
+
+    def _drain_inotify(self):
+        changed, rescan = set(), False
+        while True:
+            try:
+                wd, mask, name = self._inotify_events.get_nowait()
+            except queue.Empty:
+                break
+            if mask & _inotify.IN_Q_OVERFLOW:
+                # Events were dropped, so only a full scan is trustworthy
+                rescan = True
+            elif wd not in self._watch_paths:
+                continue
+            elif mask & _inotify.IN_IGNORED:
+                # The kernel dropped the watch (e.g. .git was deleted); forget
+                # it and rescan, which re-watches a recreated .git afresh
+                del self._watch_paths[wd]
+                for path, watched in self._watch_wds.items():
+                    if watched == wd:
+                        del self._watch_wds[path]
+                        break
+                rescan = True
+            elif self._watch_paths[wd] is None:
+                if self._is_folder_event(mask, name):
+                    rescan = True
+            elif name == "COMMIT_EDITMSG":
+                changed.add(self._watch_paths[wd])
+        if rescan:
+            self.refresh_data()
+        elif changed:
+            self._update_commit_times(changed)
+        self.root.after(250, self._drain_inotify)
+
+    def _is_folder_event(self, mask, name):
+        # Only folders (or links to them) under BASE_PATH can be repos; the
+        # document saves and temp files coming and going beside them can't
+        # change the list, so they shouldn't cost a full rescan
+        if name.startswith("."):
+            return False
+        if mask & _inotify.IN_ISDIR:
+            return True
+        path = os.path.join(os.path.expanduser(BASE_PATH), name)
+        if mask & (_inotify.IN_DELETE | _inotify.IN_MOVED_FROM):
+            # Already gone, so go by whether it was listed (a symlinked repo)
+            return path in self._row_ids
+        # A new symlink carries no IN_ISDIR; one stat says where it points
+        return os.path.isdir(path)
+
+    def _update_commit_times(self, paths):
+        now = time.time()
+        for repo in self.all_repos:
+            if repo.path not in paths:
+                continue
+            try:
+                repo.mtime = get_commit_mtime(repo.path, None)
+            except OSError:
+                continue
+            repo.time_ago = time_ago_for(repo.path, repo.mtime, now)
+            self.tree.set(repo.path, "Last Commit", repo.time_ago)
+        self._sort_by_mtime()
         col = "Last Commit" if self.sort_reverse["Last Commit"] else "Name"
         self.sort_column(col, toggle=False)
+
+    def _tick_labels(self):
+        # Labels are stored per repo and otherwise only change on a rescan,
+        # so an open window would keep saying "5m ago" for hours. Recheck
+        # once a minute; time_ago_for only reformats labels whose bucket has
+        # rolled over, and only rows whose text changed are touched.
+        now = time.time()
+        for repo in self.all_repos:
+            label = time_ago_for(repo.path, repo.mtime, now)
+            if label != repo.time_ago:
+                repo.time_ago = label
+                self.tree.set(repo.path, "Last Commit", label)
+        self.root.after(60_000, self._tick_labels)
+
+    def _sort_by_mtime(self):
+        # Pull the key column out with attrgetter so the sort itself runs
+        # entirely in C (no Python lambda call per comparison key)
+        mtimes = list(map(attrgetter("mtime"), self.all_repos))
+        self._by_mtime = sorted(range(len(mtimes)), key=mtimes.__getitem__)
+
+    def refresh_data(self, auto=False):
         self.btn_open.config(text=f"OPEN IN {EDITOR_COMMAND.upper()}")
+        if auto and not SCAN_REMOTE and is_remote_fs(BASE_PATH):
+            self.remote_banner.pack(
+                before=self.tree_frame, fill=tk.X, padx=15, pady=(5, 0), ipady=4
+            )
+            self.status_var.set("Scan skipped on remote filesystem")
+            return
+        self.remote_banner.pack_forget()
+        # Scan in a worker thread so a slow BASE_PATH doesn't freeze the UI
+        self._scan_token += 1
+        self.status_var.set("Scanning…")
+        self.btn_refresh.config(state=tk.DISABLED)
+        token = self._scan_token
+        future = self._executor.submit(scan_repos, BASE_PATH)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_scan, token, f.result())
+        )
+
+    def _apply_scan(self, token, results):
+        # A newer scan was started (e.g. BASE_PATH changed), drop stale results
+        if token != self._scan_token:
+            return
+        previous, self.all_repos = self.all_repos, results
+        self.btn_refresh.config(state=tk.NORMAL)
+        if [r.path for r in previous] == [r.path for r in results]:
+            # Same repos as last scan (the usual ↻ case): keep the rows, and
+            # with them selection and scroll position, relabel only what moved
+            moved = False
+            for old, new in zip(previous, results):
+                if old.mtime != new.mtime:
+                    moved = True
+                if old.time_ago != new.time_ago:
+                    self.tree.set(new.path, "Last Commit", new.time_ago)
+            if moved:
+                self._sort_by_mtime()
+        else:
+            # Sort both ways once per scan; clicking a header just picks a list
+            self._names_lower = list(map(attrgetter("name_lower"), results))
+            self._by_name = sorted(
+                range(len(results)), key=self._names_lower.__getitem__
+            )
+            self._sort_by_mtime()
+            self._rebuild_items()
+        if self._inotify:
+            self._update_watches(os.path.expanduser(BASE_PATH), results)
+        col = "Last Commit" if self.sort_reverse["Last Commit"] else "Name"
+        self.sort_column(col, toggle=False)
 
     def sort_column(self, col, toggle=True):
         reverse = self.sort_reverse[col]
-        self.all_repos.sort(
-            key=lambda x: x["name"].lower() if col == "Name" else x["mtime"],
-            reverse=reverse,
-        )
+        order = self._by_name if col == "Name" else self._by_mtime
+        self._order = order[::-1] if reverse else order
         if toggle:
             self.sort_reverse[col] = not reverse
-        self.update_list()
-
-    def update_list(self, *args):
-        search_term = self.search_var.get().lower()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.displayed_paths = []
-        count = 0
+        self._last_term, self._last_matches = "", self._order
+        self._do_update_list()
+
+    def _rebuild_items(self):
+        # get_children() skips rows detached by a search, so go by our own ids
+        self.tree.delete(*self._row_ids)
+        rows = []
+        append = rows.append
         for repo in self.all_repos:
-            if search_term in repo["name"].lower():
-                tag = "evenrow" if count % 2 == 0 else "oddrow"
-                self.tree.insert(
-                    "",
-                    tk.END,
-                    values=(f"  {repo['name']}", repo["time_ago"]),
-                    tags=(tag,),
-                )
-                self.displayed_paths.append(repo["path"])
-                count += 1
-        self.status_var.set(f"Found {count} repositories")
+            append(repo.path)
+            append(repo.display_name)
+            append(repo.time_ago)
+        self.tree.tk.call("gitdash_fill", self.tree, tuple(rows))
+        self._row_ids = tuple(repo.path for repo in self.all_repos)
+        # Filled rows are all attached and striped in fill order
+        self._shown = self._row_ids
+        self._render_upto = RENDER_PAGE
+
+    def _on_search_changed(self, *args):
+        # Coalesce a burst of keystrokes (or a paste) into a single filter pass
+        if self._pending_filter:
+            self.root.after_cancel(self._pending_filter)
+        self._pending_filter = self.root.after(80, self._do_update_list)
+
+    def _do_update_list(self):
+        # Sorting or a finished scan filters right away; drop any debounced
+        # pass still queued so the same work doesn't run twice
+        if self._pending_filter:
+            self.root.after_cancel(self._pending_filter)
+            self._pending_filter = None
+        search_term = self.search_var.get().casefold()
+        if search_term.startswith(self._last_term):
+            candidates = self._last_matches
+        else:
+            candidates = self._order
+        matches = filter_repos(self._names_lower, candidates, search_term)
+        self._last_term, self._last_matches = search_term, matches
+        self._matched = tuple(self.all_repos[i].path for i in matches)
+        self.status_var.set(f"Found {len(self._matched)} repositories")
+        # Pages already scrolled into stay attached, so a re-sort or rescan
+        # doesn't pull rows out from under a scrolled view
+        visible = self._matched[: self._render_upto]
+        if visible == self._shown:
+            # e.g. a keystroke that matched the same rows, or a rescan that
+            # changed no order: skip the Tcl round-trip and the redraw
+            return
+        # Only rows that were attached can need detaching
+        shown = set(visible)
+        hidden = [iid for iid in self._shown if iid not in shown]
+        if hidden:
+            self.tree.selection_remove(*hidden)
+            self.tree.detach(*hidden)
+        # move also reattaches rows hidden by a previous search
+        self.tree.tk.call("gitdash_show", self.tree, visible)
+        self._shown = visible
+
+    def _on_tree_scroll(self, first, last):
+        # yscrollcommand fires on wheel, keys, resize and content changes
+        # alike; whenever the bottom is in view, attach the next page
+        count = len(self._shown)
+        if float(last) >= 1.0 and count < len(self._matched):
+            page = self._matched[count : count + RENDER_PAGE]
+            self.tree.tk.call("gitdash_show", self.tree, page, count)
+            self._shown += page
+            self._render_upto = len(self._shown)
 
     def open_repo(self, event=None):
         selection = self.tree.selection()
         if selection:
-            index = self.tree.index(selection[0])
-            # Popen starts Zed and lets Python continue/exit immediately
-            subprocess.Popen(
-                [EDITOR_COMMAND, self.displayed_paths[index]],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            # Row ids are repo paths
+            launch_editor([EDITOR_COMMAND, selection[0]])
 
 
 if __name__ == "__main__":
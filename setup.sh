@@ -12,12 +12,17 @@ echo "--- Starting Git Repo Dashboard Setup ---"
 python3 -c "import tkinter" &> /dev/null || sudo apt update && sudo apt install -y python3-tk
 pip install python-dotenv
 
-# 2. Permissions & Link
+# 2. Optional: compile the hot-path helpers (pure Python is used otherwise)
+if command -v mypyc &> /dev/null; then
+    mypyc dashboard_hot.py > /dev/null && echo "✔ Compiled dashboard_hot.py with mypyc"
+fi
+
+# 3. Permissions & Link
 chmod +x "$SCRIPT_PATH"
 mkdir -p "$HOME/.local/bin"
 ln -sf "$SCRIPT_PATH" "$BIN_LINK"
 
-# 3. Add Function (Removing any old alias first to avoid conflicts)
+# 4. Add Function (Removing any old alias first to avoid conflicts)
 # We use sed to clean up the bashrc so we don't have duplicate/conflicting commands
 sed -i '/alias repos=/d' "$HOME/.bashrc"
 sed -i '/repos() {/,/}/d' "$HOME/.bashrc"